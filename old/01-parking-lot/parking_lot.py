@@ -27,12 +27,18 @@ FOCUS ON:
 Time: 45-60 minutes
 """
 
+import sys
+import time
+from collections import deque
 from enum import Enum
-from uuid import uuid4
+from itertools import count
 from datetime import datetime
-from math import ceil
 from abc import ABC
 
+# Process-wide ticket id source: avoids the urandom syscall and UUID
+# formatting per ticket, and small ints hash to themselves
+_ticket_id_counter = count(1)
+
 
 class VehicleType(Enum):
     """Supported Vehicles Types"""
@@ -51,13 +57,17 @@ class SpotSize(Enum):
 class Vehicle(ABC):
     """Represents a vehicle in Parking Lot"""
     vehicle_type: VehicleType | None = None
+    required_spot_size: SpotSize | None = None
+
+    __slots__ = ("license_plate",)
 
     def __init__(self, license_plate: str) -> None:
         if self.vehicle_type is None:
             raise NotImplementedError(
                 f"{self.__class__.__name__} must define 'vehicle_type' class attribute"
             )
-        self.license_plate = license_plate
+        # Interned so dict lookups on the plate hit pointer equality
+        self.license_plate = sys.intern(license_plate)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Vehicle):
@@ -84,6 +94,9 @@ class Motorcycle(Vehicle):
     Requires compact parking spots.
     """
     vehicle_type = VehicleType.MOTORCYCLE
+    required_spot_size = SpotSize.COMPACT
+
+    __slots__ = ()
 
     def __init__(self, license_plate: str) -> None:
         super().__init__(license_plate)
@@ -95,6 +108,9 @@ class Car(Vehicle):
     Requires regular parking spots.
     """
     vehicle_type = VehicleType.CAR
+    required_spot_size = SpotSize.REGULAR
+
+    __slots__ = ()
 
     def __init__(self, license_plate: str) -> None:
         super().__init__(license_plate)
@@ -106,6 +122,9 @@ class Truck(Vehicle):
     Requires large parking spots.
     """
     vehicle_type = VehicleType.TRUCK
+    required_spot_size = SpotSize.LARGE
+
+    __slots__ = ()
 
     def __init__(self, license_plate: str) -> None:
         super().__init__(license_plate)
@@ -124,10 +143,13 @@ class ParkingSpot:
         SpotSize.LARGE: 3
     }  # Scale size for comparison
 
+    __slots__ = ("id", "size", "is_available", "_rank")
+
     def __init__(self, id: str, size: SpotSize) -> None:
         self.id = id
         self.size = size
         self.is_available: bool = True
+        self._rank = self.SPOT_SIZE[size]  # Resolved once, used on every fit check
 
     def __eq__(self, other) -> bool:
         return isinstance(other, ParkingSpot) and self.id == other.id
@@ -136,24 +158,37 @@ class ParkingSpot:
         return hash(self.id)
 
     def can_fit_spot(self, vehicle: Vehicle) -> bool:
-        return self.SPOT_SIZE[self.size] >= self.SPOT_SIZE[self.VEHICLE_TYPE_TO_SPOT_SIZE[vehicle.vehicle_type]]
+        return self._rank >= _VEHICLE_TO_REQUIRED_RANK[vehicle.vehicle_type]
 
     def __repr__(self) -> str:
         status = 'Available' if self.is_available else 'Occupied'
         return f"Parking Spot (id: {self.id}, size: {self.size}, status: {status}"
 
 
+# Flat VehicleType -> required rank mapping, precomputed once at import so
+# hot paths do a single dict probe instead of two chained lookups
+_VEHICLE_TO_REQUIRED_RANK = {
+    vt: ParkingSpot.SPOT_SIZE[ps]
+    for vt, ps in ParkingSpot.VEHICLE_TYPE_TO_SPOT_SIZE.items()
+}
+
+
 class ParkingTicket:
     """Represents a Parking Ticket"""
 
+    __slots__ = ("id", "vehicle", "parking_spot", "start_time", "price", "finish_time", "_t0", "_t1")
+
     def __init__(self, vehicle: Vehicle, parking_spot: ParkingSpot) -> None:
-        self.id = uuid4()
+        self.id = next(_ticket_id_counter)
         self.vehicle = vehicle
         self.parking_spot = parking_spot
 
         self.start_time: datetime = datetime.now()
         self.price: float = 0.0
         self.finish_time: datetime | None = None
+        # Monotonic timestamps for duration math; datetimes are display-only
+        self._t0: float = time.monotonic()
+        self._t1: float | None = None
 
     def __eq__(self, other) -> bool:
         return isinstance(other, ParkingTicket) and self.id == other.id
@@ -182,13 +217,26 @@ class ParkingLot:
         }  # Dollars
 
     FREE_TIME = 0.5  # Hours
+    _FREE_SECONDS = int(FREE_TIME * 3600)
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, dense_ids: bool = False) -> None:
         self.name = name
 
         self.spots: dict[str, ParkingSpot] = {}
-        self.open_tickets: dict[Vehicle, ParkingTicket] = {}
-        self.close_tickets: list[ParkingTicket] = []
+        # Keyed by plate string so lookups use C-level str hashing instead
+        # of dispatching Vehicle.__hash__/__eq__
+        self.open_tickets: dict[str, ParkingTicket] = {}
+        self.close_tickets: deque[ParkingTicket] = deque()
+        # Index of available spot ids per size, so finding a spot is O(1)
+        # instead of scanning every spot on each arrival
+        self._available_by_size: dict[SpotSize, set[str]] = {s: set() for s in SpotSize}
+        self._available_count: int = 0
+        # Dense mode: sequential integer spot ids are stored in a flat
+        # array with per-size LIFO free stacks, so park/release does array
+        # indexing and list push/pop with no string hashing at all
+        self.dense_ids = dense_ids
+        self._spots_arr: list[ParkingSpot | None] = []
+        self._free_stacks: dict[SpotSize, list[int]] = {s: [] for s in SpotSize}
 
     def __eq__(self, other) -> bool:
         return isinstance(other, ParkingLot) and self.name == other.name
@@ -198,61 +246,100 @@ class ParkingLot:
 
     def add_spot(self, spot: ParkingSpot) -> ParkingSpot:
         """Add a new spot to parking lot."""
-        if spot.id in self.spots.keys():
+        if self.dense_ids:
+            if not isinstance(spot.id, int) or spot.id < 0:
+                raise ValueError(f"Spot id {spot.id} must be a non-negative int in a dense lot")
+            if spot.id < len(self._spots_arr) and self._spots_arr[spot.id] is not None:
+                raise ValueError(f"Spot {spot.id} already exist.")
+            while len(self._spots_arr) <= spot.id:
+                self._spots_arr.append(None)
+            self._spots_arr[spot.id] = spot
+            if spot.is_available:
+                self._free_stacks[spot.size].append(spot.id)
+                self._available_count += 1
+            return spot
+        if spot.id in self.spots:
             raise ValueError(f"Spot {spot.id} already exist.")
         self.spots[spot.id] = spot
+        if spot.is_available:
+            self._available_by_size[spot.size].add(spot.id)
+            self._available_count += 1
         return spot
 
     def remove_spot(self, spot: ParkingSpot) -> ParkingSpot:
         """Remove a spot from parking lot."""
-        if spot.id not in self.spots.keys():
+        if self.dense_ids:
+            if spot.id >= len(self._spots_arr) or self._spots_arr[spot.id] is None:
+                raise ValueError(f"Spot {spot.id} don't exist")
+            self._spots_arr[spot.id] = None
+            if spot.is_available:
+                self._free_stacks[spot.size].remove(spot.id)
+                self._available_count -= 1
+            return spot
+        if spot.id not in self.spots:
             raise ValueError(f"Spot {spot.id} don't exist")
+        self._available_by_size[spot.size].discard(spot.id)
+        if spot.is_available:
+            self._available_count -= 1
         return self.spots.pop(spot.id)
 
     def _find_spot(self, vehicle: Vehicle) -> ParkingSpot | None:
         """STRICT: Apenas spots EXATAMENTE do tamanho certo"""
-        required_size = ParkingSpot.VEHICLE_TYPE_TO_SPOT_SIZE[vehicle.vehicle_type]
+        required_size = vehicle.required_spot_size
 
-        return next(
-            (s for s in self.spots.values() if s.is_available and s.size == required_size),
-            None
-        )
+        if self.dense_ids:
+            stack = self._free_stacks[required_size]
+            return self._spots_arr[stack[-1]] if stack else None
+        spot_id = next(iter(self._available_by_size[required_size]), None)
+        return self.spots[spot_id] if spot_id else None
 
     def _calculate_price(self, ticket) -> float:
-        duration = (ticket.finish_time - ticket.start_time).total_seconds() / (60 * 60)
-        if duration <= self.FREE_TIME:
+        seconds = int(ticket._t1 - ticket._t0)
+        if seconds <= self._FREE_SECONDS:
             return 0
-        else:
-            return ceil(duration) * self.SPOT_FEE_HOUR[ticket.parking_spot.size]
+        hours = (seconds + 3599) // 3600  # Integer ceil, no float math
+        return hours * self.SPOT_FEE_HOUR[ticket.parking_spot.size]
 
     def open_ticket(self, vehicle: Vehicle) -> ParkingTicket | None:
         """Open a parking ticket for a vehicle"""
-        if vehicle in self.open_tickets:
+        if vehicle.license_plate in self.open_tickets:
             raise ValueError(f"Vehicle {vehicle.license_plate} is already parked")
         spot = self._find_spot(vehicle)
         if not spot:
             return None
         spot.is_available = False
+        if self.dense_ids:
+            self._free_stacks[spot.size].pop()
+        else:
+            self._available_by_size[spot.size].discard(spot.id)
+        self._available_count -= 1
         ticket = ParkingTicket(vehicle, spot)
-        self.open_tickets[vehicle] = ticket
+        self.open_tickets[vehicle.license_plate] = ticket
         return ticket
 
     def close_ticket(self, vehicle: Vehicle) -> ParkingTicket:
         """Close a parking ticket for vehicle"""
-        if vehicle not in self.open_tickets:
+        if vehicle.license_plate not in self.open_tickets:
             raise ValueError("This Vehicle is not park here")
-        ticket = self.open_tickets.pop(vehicle)
+        ticket = self.open_tickets.pop(vehicle.license_plate)
         ticket.finish_time = datetime.now()
+        ticket._t1 = time.monotonic()
         ticket.price = self._calculate_price(ticket)
         ticket.parking_spot.is_available = True
+        if self.dense_ids:
+            self._free_stacks[ticket.parking_spot.size].append(ticket.parking_spot.id)
+        else:
+            self._available_by_size[ticket.parking_spot.size].add(ticket.parking_spot.id)
+        self._available_count += 1
         self.close_tickets.append(ticket)
         return ticket
 
     def __repr__(self) -> str:
-        available = sum(1 for spot in self.spots.values() if spot.is_available)
+        available = self._available_count
+        total = len(self.spots) if not self.dense_ids else sum(s is not None for s in self._spots_arr)
         return (
                 f"Parking Lot {self.name}"
-                f"Available Spots: {available}/{len(self.spots)}, "
+                f"Available Spots: {available}/{total}, "
                 f"Vehicles Park Now: {len(self.open_tickets)}, "
                 f"Vehicle Parked All Time: {len(self.close_tickets)}."
         )
@@ -153,14 +153,14 @@ class ParkingLot:
 
     def add_spot(self, spot: ParkingSpot) -> ParkingSpot:
         """Add a new spot to parking lot."""
-        if spot.id in self.spots.keys():
+        if spot.id in self.spots:
             raise ValueError(f"Spot {spot.id} already exist.")
         self.spots[spot.id] = spot
         return spot
 
     def remove_spot(self, spot: ParkingSpot) -> ParkingSpot:
         """Remove a spot from parking lot."""
-        if spot.id not in self.spots.keys():
+        if spot.id not in self.spots:
             raise ValueError(f"Spot {spot.id} don't exist")
         return self.spots.pop(spot.id)
 
@@ -20,18 +20,31 @@ Objects:
 Time: 30-40 minutes
 """
 
+import bisect
+import sys
+from collections import deque
 from datetime import timedelta, date
-import uuid
+import itertools
+
+# Process-wide id source: small ints hash to themselves and skip the
+# urandom syscall + 36-char formatting that uuid4 paid per object
+_id_counter = itertools.count(1)
 
 
 class Book:
     """Represents a book in the library catalog"""
 
+    __slots__ = ("id", "title", "author", "isbn", "_title_lower", "_author_lower")
+
     def __init__(self, title: str, author: str, isbn: str) -> None:
-        self.id: str = str(uuid.uuid4())
+        self.id: int = next(_id_counter)
         self.title = title
         self.author = author
-        self.isbn = isbn
+        self.isbn = sys.intern(isbn)
+        # Lowercased once at creation so searches don't re-lower every book;
+        # interned so repeated titles/authors share one string object
+        self._title_lower = sys.intern(title.lower())
+        self._author_lower = sys.intern(author.lower())
 
     def __eq__(self, other) -> bool:
         return isinstance(other, Book) and self.id == other.id
@@ -49,10 +62,12 @@ class Book:
 class Member:
     """Represents a Member of the library, who can borrow books"""
 
+    __slots__ = ("id", "name", "email", "outstanding_fees")
+
     def __init__(self, name: str, email: str) -> None:
-        self.id: str = str(uuid.uuid4())
+        self.id: int = next(_id_counter)
         self.name = name
-        self.email = email
+        self.email = sys.intern(email)
         self.outstanding_fees: float = 0.0
 
     def __eq__(self, other) -> bool:
@@ -76,13 +91,20 @@ class Loan:
     a 14-day loan period at $0.50 per day after due date.
     """
 
+    FEE_PER_DAY_EXTRA = 0.50  # Dollars per day, mirrored from Library
+
+    __slots__ = ("id", "book", "member", "date_checkout", "date_due", "late_fee",
+                 "_cached_fee_date", "_cached_fee")
+
     def __init__(self, book: Book, member: Member, date_due: date):
-        self.id: str = str(uuid.uuid4())
+        self.id: int = next(_id_counter)
         self.book = book
         self.member = member
         self.date_checkout: date = date.today()
         self.date_due = date_due
         self.late_fee = 0.0
+        self._cached_fee_date: date | None = None
+        self._cached_fee: float = 0.0
 
     def __eq__(self, other) -> bool:
         return isinstance(other, Loan) and self.id == other.id
@@ -92,9 +114,15 @@ class Loan:
 
     def _calculate_late_fee(self, return_date: date | None = None) -> float:
         check_date = return_date or date.today()
+        if check_date == self._cached_fee_date:
+            return self._cached_fee
         if check_date > self.date_due:
-            return (check_date - self.date_due).days * Library.FEE_PER_DAY_EXTRA
-        return 0
+            fee = (check_date - self.date_due).days * self.FEE_PER_DAY_EXTRA
+        else:
+            fee = 0
+        self._cached_fee_date = check_date
+        self._cached_fee = fee
+        return fee
 
     def __str__(self) -> str:
         return f"Member {self.member.name} loan the book {self.book.title}"
@@ -108,21 +136,40 @@ class Library:
     MAX_BOOKS = 3
     FREE_DAYS = 14
     FEE_PER_DAY_EXTRA = 0.50  # Dollars per day
+    _LOAN_PERIOD = timedelta(days=FREE_DAYS)  # Built once at import
 
     def __init__(self, name: str) -> None:
         self.name = name
-        self.members: dict[str, Member] = {}
-        self.books: dict[str, Book] = {}
+        self.members: dict[int, Member] = {}
+        self.books: dict[int, Book] = {}
         self.active_loans: dict[Book, Loan] = {}
-        self.historic_loans: list[Loan] = []
+        self.historic_loans: deque[Loan] = deque()
+        # Count of active loans per member id, so the cap check is O(1)
+        # instead of scanning every active loan on each borrow
+        self._active_loans_by_member: dict[int, int] = {}
+        # Registered emails, so the uniqueness check is O(1) instead of
+        # scanning every member on each registration
+        self._emails: set[str] = set()
+        # Inverted index of lowercase title/author tokens to book ids, so
+        # single-word searches are an O(1) probe instead of a catalog scan
+        self._token_index: dict[str, set[int]] = {}
+        # Kept sorted on insert with bisect so the show_* views only
+        # iterate instead of re-sorting on every call (id breaks ties)
+        self._members_sorted: list[tuple[str, int, Member]] = []
+        self._books_sorted: list[tuple[str, int, Book]] = []
+        # Memo of substring-search results for repeated queries against a
+        # stable catalog; invalidated whenever a book is added
+        self._search_cache: dict[str, list[Book]] = {}
 
     def add_member(self, member: Member) -> str:
         """Add new Member to the library"""
         if member.id in self.members:
             raise ValueError(f"Member {member.id} already registered")
-        elif any(m.email == member.email for m in self.members.values()):
+        elif member.email in self._emails:
             raise ValueError(f"Email {member.email} already used")
         self.members[member.id] = member
+        self._emails.add(member.email)
+        bisect.insort(self._members_sorted, (member.name, member.id, member))
         return f"Member {member.name} added to the library members"
 
     def add_book(self, book: Book) -> str:
@@ -130,66 +177,80 @@ class Library:
         if book.id in self.books:
             raise ValueError(f"Book {book.id} is already registered in the collection")
         self.books[book.id] = book
+        bisect.insort(self._books_sorted, (book.title, book.id, book))
+        for token in book._title_lower.split() + book._author_lower.split():
+            self._token_index.setdefault(token, set()).add(book.id)
+        self._search_cache.clear()
         return f"Book {book.title} by {book.author}, isbn ({book.isbn}))"
 
     def show_members(self) -> None:
         """Display all registered members in alphabetical order."""
-        sorted_members = sorted(self.members.values(), key=lambda m: m.name)
-        print("\nLibrary's Members")
-        if sorted_members:
-            for index, member in enumerate(sorted_members, start=1):
-                print(f"{index} - {member}")
+        lines = ["\nLibrary's Members"]
+        if self._members_sorted:
+            lines.extend(f"{index} - {member}" for index, (_, _, member) in enumerate(self._members_sorted, start=1))
         else:
-            print("Don't have any members registered yet")
+            lines.append("Don't have any members registered yet")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def show_books(self) -> None:
         """Display all registered books in alphabetical order."""
-        sorted_books = sorted(self.books.values(), key=lambda b: b.title)
-        print("\nLibrary's Books")
-        if sorted_books:
-            for index, book in enumerate(sorted_books, start=1):
-                status = 'Avaliable' if book not in self.active_loans else "Borrowed"
-                print(f"{index} - {book} is {status}")
+        lines = ["\nLibrary's Books"]
+        if self._books_sorted:
+            lines.extend(
+                f"{index} - {book} is {'Avaliable' if book not in self.active_loans else 'Borrowed'}"
+                for index, (_, _, book) in enumerate(self._books_sorted, start=1)
+            )
         else:
-            print("Don't have any book registered yet")
+            lines.append("Don't have any book registered yet")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def show_active_loans(self) -> None:
-        sorted_loan = sorted(self.active_loans.values(), key=lambda loan: loan.date_checkout)
-        print("\nLibrary's Actives loans")
-        if sorted_loan:
-            for index, loan in enumerate(sorted_loan, start=1):
-                print(f"{index} - {loan.date_checkout.isoformat()}: {loan}")
+        # Loans enter active_loans at checkout, so insertion order is
+        # already checkout-date order; no re-sort needed
+        lines = ["\nLibrary's Actives loans"]
+        if self.active_loans:
+            lines.extend(
+                f"{index} - {loan.date_checkout.isoformat()}: {loan}"
+                for index, loan in enumerate(self.active_loans.values(), start=1)
+            )
         else:
-            print("Don't have any active loan")
+            lines.append("Don't have any active loan")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def show_loan_history(self) -> None:
         sorted_loan = sorted(self.historic_loans, key=lambda loan: loan.date_checkout)
-        print("\nLibrary's Historic of loans")
+        lines = ["\nLibrary's Historic of loans"]
         if sorted_loan:
-            for index, loan in enumerate(sorted_loan, start=1):
-                print(f"{index} - {loan.date_checkout.isoformat()}: {loan}")
+            lines.extend(
+                f"{index} - {loan.date_checkout.isoformat()}: {loan}"
+                for index, loan in enumerate(sorted_loan, start=1)
+            )
         else:
-            print("Library Don't have any historic loan yet")
+            lines.append("Library Don't have any historic loan yet")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def member_borrow_book(self, book: Book, member: Member) -> Loan:
         """Member borrow a book making a loan"""
+        bid = book.id if book else None
+        mid = member.id if member else None
 
-        if book and book.id not in self.books:
-            raise ValueError(f"Book {book.id} dont exist in Library's Collection")
+        if book and bid not in self.books:
+            raise ValueError(f"Book {bid} dont exist in Library's Collection")
 
-        if member and member.id not in self.members:
-            raise ValueError(f"Member {member.id} dont exist in Library's Members")
+        if member and mid not in self.members:
+            raise ValueError(f"Member {mid} dont exist in Library's Members")
 
         if book in self.active_loans:
-            raise ValueError(f"Book {book.id} already borrowed")
+            raise ValueError(f"Book {bid} already borrowed")
 
-        qnt_loan_member = sum(1 for loan in self.active_loans.values() if loan.member.id == member.id)
+        qnt_loan_member = self._active_loans_by_member.get(mid, 0)
         if qnt_loan_member >= self.MAX_BOOKS:
             raise ValueError(f"Member already have borrowed {qnt_loan_member} is the limit per member")
 
-        date_due = date.today() + timedelta(days=self.FREE_DAYS)
+        date_due = date.today() + self._LOAN_PERIOD
         loan = Loan(book, member, date_due)
         self.active_loans[book] = loan
+        self._active_loans_by_member[mid] = qnt_loan_member + 1
         return loan
 
     def member_return_book(self, book: Book) -> Loan:
@@ -201,6 +262,12 @@ class Library:
             raise ValueError(f"Book {book.id} already returned")
 
         loan = self.active_loans.pop(book)
+        mid = loan.member.id
+        remaining = self._active_loans_by_member.get(mid, 0) - 1
+        if remaining > 0:
+            self._active_loans_by_member[mid] = remaining
+        else:
+            self._active_loans_by_member.pop(mid, None)
         loan.late_fee = loan._calculate_late_fee()
         loan.member.outstanding_fees += loan.late_fee
         self.historic_loans.append(loan)
@@ -210,11 +277,18 @@ class Library:
     def search_book(self, query: str) -> list[Book]:
         """Search Books for title or author"""
         query_lower = query.lower()
+        if query_lower in self._token_index:
+            return [self.books[book_id] for book_id in self._token_index[query_lower]]
+        cached = self._search_cache.get(query_lower)
+        if cached is not None:
+            return list(cached)
+        # Fallback substring scan over the precomputed lowercase fields
         matches = [
             book for book in self.books.values()
-            if query_lower in book.title.lower() or query_lower in book.author.lower()
+            if query_lower in book._title_lower or query_lower in book._author_lower
         ]
-        return matches
+        self._search_cache[query_lower] = matches
+        return list(matches)
 
     def __str__(self) -> str:
         return f"Library {self.name} with {len(self.books)} books!"
@@ -14,16 +14,48 @@ Design Patterns:
 from __future__ import annotations
 from dataclasses import dataclass, field
 from decimal import Decimal, ROUND_HALF_UP
-from uuid import uuid4, UUID
 from datetime import datetime
+import itertools
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
+
+# Process-wide id source: small ints hash to themselves and skip the
+# urandom syscall + UUID allocation per account/transaction
+_id_counter = itertools.count(1)
 
 # ========== CONSTANTS ==========
 MIN_WITHDRAWAL_AMOUNT = Decimal('10.00')
 MIN_DEPOSIT_AMOUNT = Decimal('0.01')
 DECIMAL_PRECISION = Decimal('0.01')
 
+# Integer-cents mirrors of the limits for the hot validation path
+_MIN_WITHDRAWAL_CENTS = 1000
+_MIN_DEPOSIT_CENTS = 1
+# Pre-built zero so balance inquiries never reparse '0.00'
+_ZERO = Decimal('0.00')
+
+
+@lru_cache(maxsize=256)
+def _to_cents(value: float) -> int:
+    """Convert an amount to integer cents for internal arithmetic.
+
+    ATM traffic repeats a small alphabet of cash denominations, so after
+    warmup each conversion is a single cache probe.
+    """
+    if type(value) is int:
+        return value * 100
+    if type(value) is Decimal:
+        return int(value.quantize(DECIMAL_PRECISION, ROUND_HALF_UP).scaleb(2))
+    return int(round(value * 100))
+
+
+@lru_cache(maxsize=256)
+def _from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a two-place Decimal at the API boundary."""
+    return Decimal(cents).scaleb(-2)
+
 
 # ========== EXCEPTIONS ==========
 class ATMError(Exception):
@@ -59,12 +91,22 @@ class TransactionsType(Enum):
     BALANCE_INQUIRY = 'BALANCE_INQUIRY'
 
 
+# Module-level aliases: enum member access costs LOAD_GLOBAL + LOAD_ATTR
+# on every transaction, the aliases are a single global load
+_TX_WITHDRAWAL = TransactionsType.WITHDRAWAL
+_TX_DEPOSIT = TransactionsType.DEPOSIT
+_TX_BALANCE_INQUIRY = TransactionsType.BALANCE_INQUIRY
+
+
 # ========== MODELS ==========
 class Account:
     """
     Represents a bank account with balance and transaction history.
     """
-    
+
+    __slots__ = ('id', 'name', 'account_code', '_balance_cents',
+                 'transactions', '_withdraw_limit_cents')
+
     def __init__(
         self, 
         name: str, 
@@ -72,17 +114,28 @@ class Account:
         withdraw_limit: float = 100.0
     ) -> None:
         """Initialize a new bank account."""
-        self.id: UUID = uuid4()
+        self.id: int = next(_id_counter)
         self.name: str = name
         self.account_code: str = account_code
-        self.balance: Decimal = self._to_decimal(0.0)
-        self.transactions: dict[UUID, Transaction] = {}
-        self.withdraw_limit: Decimal = self._to_decimal(withdraw_limit)
-
-    @staticmethod
-    def _to_decimal(value: float) -> Decimal:
-        """Convert float to Decimal with proper rounding for currency"""
-        return Decimal(str(value)).quantize(DECIMAL_PRECISION, ROUND_HALF_UP)
+        # Money lives as integer cents; Decimal is rebuilt only at the
+        # API boundary by the balance/withdraw_limit properties
+        self._balance_cents: int = 0
+        # History is append-only and only ever iterated or counted, so a
+        # list beats a dict keyed by transaction id
+        self.transactions: list[Transaction] = []
+        self._withdraw_limit_cents: int = _to_cents(withdraw_limit)
+
+    @property
+    def balance(self) -> Decimal:
+        return _from_cents(self._balance_cents)
+
+    @balance.setter
+    def balance(self, value: float) -> None:
+        self._balance_cents = _to_cents(value)
+
+    @property
+    def withdraw_limit(self) -> Decimal:
+        return _from_cents(self._withdraw_limit_cents)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Account):
@@ -90,21 +143,22 @@ class Account:
         return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash(self.id)
+        # ids are small positive ints, which hash to themselves
+        return self.id
 
-    def debit(self, amount: Decimal) -> Decimal:
-        """Subtract amount from account balance."""
-        self.balance -= amount
-        return self.balance
+    def debit(self, amount_cents: int) -> int:
+        """Subtract amount in cents from account balance."""
+        self._balance_cents -= amount_cents
+        return self._balance_cents
 
-    def credit(self, amount: Decimal) -> Decimal:
-        """Add amount to account balance."""
-        self.balance += amount
-        return self.balance
+    def credit(self, amount_cents: int) -> int:
+        """Add amount in cents to account balance."""
+        self._balance_cents += amount_cents
+        return self._balance_cents
 
     def add_transaction(self, transaction: Transaction) -> None:
         """Add transaction to account history"""
-        self.transactions[transaction.id] = transaction
+        self.transactions.append(transaction)
 
     def __repr__(self) -> str:
         return (
@@ -117,7 +171,7 @@ class Account:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transaction:
     """
     Immutable record of a bank transaction.
@@ -125,9 +179,11 @@ class Transaction:
     type: TransactionsType
     amount: Decimal
     balance_after: Decimal
-    account_id: UUID
-    id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=datetime.now)
+    account_id: int
+    id: int = field(default_factory=_id_counter.__next__)
+    # Stored as integer nanoseconds; time.time_ns is cheaper than
+    # datetime.now and the datetime is materialized only in __repr__
+    created_at: int = field(default_factory=time.time_ns)
 
     def __repr__(self) -> str:
         return (
@@ -135,7 +191,7 @@ class Transaction:
             f"type={self.type.value}, "
             f"amount={self.amount}, "
             f"balance_after={self.balance_after}, "
-            f"created_at={self.created_at.strftime('%Y-%m-%d %H:%M:%S')})"
+            f"created_at={datetime.fromtimestamp(self.created_at / 1e9).strftime('%Y-%m-%d %H:%M:%S')})"
         )
 
 
@@ -156,10 +212,21 @@ class ValidatorChain(ABC):
         self._next = validator
         return validator
 
+    def validate(self, account: Account, amount: int) -> None:
+        """
+        Validate the transaction (amount in cents) and pass it on.
+        
+        Raises:
+            ATMError: If validation fails
+        """
+        self.validate_one(account, amount)
+        if self._next:
+            self._next.validate(account, amount)
+
     @abstractmethod
-    def validate(self, account: Account, amount: Decimal) -> None:
+    def validate_one(self, account: Account, amount: int) -> None:
         """
-        Validate the transaction.
+        Run only this link's check, without forwarding to the next one.
         
         Raises:
             ATMError: If validation fails
@@ -170,7 +237,7 @@ class ValidatorChain(ABC):
 class AmountValidatorChain(ValidatorChain):
     """Validates that withdrawal amount meets minimum requirements"""
     
-    def validate(self, account: Account, amount: Decimal) -> None:
+    def validate_one(self, account: Account, amount: int) -> None:
         """
         Validate withdrawal amount is positive and multiple of minimum.
         
@@ -180,73 +247,61 @@ class AmountValidatorChain(ValidatorChain):
         if amount <= 0:
             raise InvalidAmountError("Amount must be greater than 0")
 
-        if amount % MIN_WITHDRAWAL_AMOUNT != 0:
+        if amount % _MIN_WITHDRAWAL_CENTS:
             raise InvalidAmountError(
                 f"Amount must be multiple of ${MIN_WITHDRAWAL_AMOUNT}"
             )
 
-        if self._next:
-            self._next.validate(account, amount)
-
 
 class BalanceValidatorChain(ValidatorChain):
     """Validates that account has sufficient funds"""
     
-    def validate(self, account: Account, amount: Decimal) -> None:
+    def validate_one(self, account: Account, amount: int) -> None:
         """
         Validate account has sufficient balance.
         
         Raises:
             InsufficientFundsError: If balance is insufficient
         """
-        if account.balance < amount:
+        if account._balance_cents < amount:
             raise InsufficientFundsError(
                 f"Insufficient funds. Available: {account.balance}, "
-                f"Requested: {amount}"
+                f"Requested: {_from_cents(amount)}"
             )
 
-        if self._next:
-            self._next.validate(account, amount)
-
 
 class LimitValidatorChain(ValidatorChain):
     """Validates that withdrawal doesn't exceed account limit"""
     
-    def validate(self, account: Account, amount: Decimal) -> None:
+    def validate_one(self, account: Account, amount: int) -> None:
         """
         Validate withdrawal is within account limit.
         
         Raises:
             ExceededWithdrawLimitError: If amount exceeds limit
         """
-        if amount > account.withdraw_limit:
+        if amount > account._withdraw_limit_cents:
             raise ExceededWithdrawLimitError(
                 f"Withdrawal limit exceeded. Limit: {account.withdraw_limit}, "
-                f"Requested: {amount}"
+                f"Requested: {_from_cents(amount)}"
             )
 
-        if self._next:
-            self._next.validate(account, amount)
-
 
 class DepositValidatorChain(ValidatorChain):
     """Validates that deposit amount is positive"""
 
-    def validate(self, account: Account, amount: Decimal) -> None:
+    def validate_one(self, account: Account, amount: int) -> None:
         """
         Validate deposit amount is positive.
 
         Raises:
             InvalidAmountError: If amount is invalid
         """
-        if amount < MIN_DEPOSIT_AMOUNT:
+        if amount < _MIN_DEPOSIT_CENTS:
             raise InvalidAmountError(
                 f"Deposit amount must be at least ${MIN_DEPOSIT_AMOUNT}"
             )
 
-        if self._next:
-            self._next.validate(account, amount)
-
 
 # ========== STRATEGY PATTERN ==========
 class TransactionStrategy(ABC):
@@ -261,11 +316,11 @@ class TransactionStrategy(ABC):
     def execute(
         self, 
         account: Account, 
-        amount: Decimal, 
+        amount: int, 
         validator: ValidatorChain | None = None
     ) -> Decimal:
         """
-        Execute the transaction and return the new balance.
+        Execute the transaction (amount in cents) and return the new balance.
 
         Raises:
             ATMError: If transaction fails
@@ -279,18 +334,19 @@ class WithdrawalStrategy(TransactionStrategy):
     def execute(
         self, 
         account: Account, 
-        amount: Decimal, 
+        amount: int, 
         validator: ValidatorChain | None = None
     ) -> Decimal:
         """Execute withdrawal: validate, debit account, record transaction."""
         if validator:
             validator.validate(account, amount)
 
-        new_balance = account.debit(amount)
+        new_balance_cents = account.debit(amount)
+        new_balance = _from_cents(new_balance_cents)
 
         transaction = Transaction(
-            type=TransactionsType.WITHDRAWAL,
-            amount=amount,
+            type=_TX_WITHDRAWAL,
+            amount=_from_cents(amount),
             account_id=account.id,
             balance_after=new_balance
         )
@@ -304,18 +360,19 @@ class DepositStrategy(TransactionStrategy):
     def execute(
         self,
         account: Account,
-        amount: Decimal,
+        amount: int,
         validator: ValidatorChain | None = None
     ) -> Decimal:
         """Execute deposit: validate, credit account, record transaction."""
         if validator:
             validator.validate(account, amount)
 
-        new_balance = account.credit(amount)
+        new_balance_cents = account.credit(amount)
+        new_balance = _from_cents(new_balance_cents)
 
         transaction = Transaction(
-            type=TransactionsType.DEPOSIT,
-            amount=amount,
+            type=_TX_DEPOSIT,
+            amount=_from_cents(amount),
             account_id=account.id,
             balance_after=new_balance
         )
@@ -329,13 +386,13 @@ class BalanceInquiryStrategy(TransactionStrategy):
     def execute(
         self,
         account: Account,
-        amount: Decimal = Decimal('0.00'),
+        amount: int = 0,
         validator: ValidatorChain | None = None
     ) -> Decimal:
         """Execute balance inquiry: record transaction, return balance."""
         transaction = Transaction(
-            type=TransactionsType.BALANCE_INQUIRY,
-            amount=Decimal('0.00'),
+            type=_TX_BALANCE_INQUIRY,
+            amount=_ZERO,
             account_id=account.id,
             balance_after=account.balance
         )
@@ -366,19 +423,34 @@ class ATMMachine:
         self.accounts: dict[str, Account] = {}
 
         # Configure withdrawal validation chain
-        self.withdrawal_validator = AmountValidatorChain()
-        self.withdrawal_validator\
-            .set_next(BalanceValidatorChain())\
-            .set_next(LimitValidatorChain())
+        amount_validator = AmountValidatorChain()
+        balance_validator = BalanceValidatorChain()
+        limit_validator = LimitValidatorChain()
+        amount_validator.set_next(balance_validator).set_next(limit_validator)
+        self.withdrawal_validator = amount_validator
+
+        # Chain resolution frozen once at construction: the hot path
+        # iterates this tuple instead of walking the linked list
+        self._withdrawal_checks = (
+            amount_validator.validate_one,
+            balance_validator.validate_one,
+            limit_validator.validate_one,
+        )
 
         # Configure deposit validation chain
         self.deposit_validator = DepositValidatorChain()
-
-        # Configure transaction strategies
+        self._deposit_checks = (self.deposit_validator.validate_one,)
+
+        # Configure transaction strategies; direct attributes skip the
+        # string hash + dict probe per dispatch, the mapping remains for
+        # callers that select strategies by name
+        self._strat_withdraw = WithdrawalStrategy()
+        self._strat_deposit = DepositStrategy()
+        self._strat_balance = BalanceInquiryStrategy()
         self.strategies: dict[str, TransactionStrategy] = {
-            'withdrawal': WithdrawalStrategy(),
-            'deposit': DepositStrategy(),
-            'balance': BalanceInquiryStrategy()
+            'withdrawal': self._strat_withdraw,
+            'deposit': self._strat_deposit,
+            'balance': self._strat_balance
         }
 
     def _get_account(self, account_code: str) -> Account:
@@ -395,11 +467,6 @@ class ATMMachine:
             )
         return account
 
-    @staticmethod
-    def _to_decimal(amount: float) -> Decimal:
-        """Convert float to Decimal with proper currency precision"""
-        return Decimal(str(amount)).quantize(DECIMAL_PRECISION, ROUND_HALF_UP)
-
     def withdrawal(self, account_code: str, amount: float) -> Decimal:
         """
         Withdraw money from account and return new balance.
@@ -411,10 +478,10 @@ class ATMMachine:
             ExceededWithdrawLimitError: If amount exceeds limit
         """
         account = self._get_account(account_code)
-        amount_decimal = self._to_decimal(amount)
-        return self.strategies['withdrawal'].execute(
-            account, amount_decimal, self.withdrawal_validator
-        )
+        amount_cents = _to_cents(amount)
+        for check in self._withdrawal_checks:
+            check(account, amount_cents)
+        return self._strat_withdraw.execute(account, amount_cents)
 
     def deposit(self, account_code: str, amount: float) -> Decimal:
         """
@@ -425,10 +492,10 @@ class ATMMachine:
             InvalidAmountError: If amount is invalid
         """
         account = self._get_account(account_code)
-        amount_decimal = self._to_decimal(amount)
-        return self.strategies['deposit'].execute(
-            account, amount_decimal, self.deposit_validator
-        )
+        amount_cents = _to_cents(amount)
+        for check in self._deposit_checks:
+            check(account, amount_cents)
+        return self._strat_deposit.execute(account, amount_cents)
 
     def balance_inquiry(self, account_code: str) -> Decimal:
         """
@@ -438,7 +505,65 @@ class ATMMachine:
             AccountNotFound: If account doesn't exist
         """
         account = self._get_account(account_code)
-        return self.strategies['balance'].execute(account)
+        return self._strat_balance.execute(account)
+
+    def withdrawal_batch(self, account_code: str, amounts: list[float]) -> list[Decimal]:
+        """
+        Withdraw a sequence of amounts and return the balance after each.
+
+        Looks the account up once and binds the hot callables to locals,
+        so per-item work is just validation plus integer arithmetic.
+
+        Raises:
+            AccountNotFound: If account doesn't exist
+            ATMError: If any amount fails validation (prior items stand)
+        """
+        account = self._get_account(account_code)
+        balances: list[Decimal] = []
+        append = balances.append
+        record = account.transactions.append
+        account_id = account.id
+        checks = self._withdrawal_checks
+        for amount in amounts:
+            amount_cents = _to_cents(amount)
+            for check in checks:
+                check(account, amount_cents)
+            new_balance = _from_cents(account.debit(amount_cents))
+            record(Transaction(
+                type=_TX_WITHDRAWAL,
+                amount=_from_cents(amount_cents),
+                account_id=account_id,
+                balance_after=new_balance
+            ))
+            append(new_balance)
+        return balances
+
+    def deposit_batch(self, account_code: str, amounts: list[float]) -> list[Decimal]:
+        """
+        Deposit a sequence of amounts and return the balance after each.
+
+        Raises:
+            AccountNotFound: If account doesn't exist
+            InvalidAmountError: If any amount fails validation
+        """
+        account = self._get_account(account_code)
+        balances: list[Decimal] = []
+        append = balances.append
+        record = account.transactions.append
+        account_id = account.id
+        validate = self.deposit_validator.validate_one
+        for amount in amounts:
+            amount_cents = _to_cents(amount)
+            validate(account, amount_cents)
+            new_balance = _from_cents(account.credit(amount_cents))
+            record(Transaction(
+                type=_TX_DEPOSIT,
+                amount=_from_cents(amount_cents),
+                account_id=account_id,
+                balance_after=new_balance
+            ))
+            append(new_balance)
+        return balances
 
     def register_account(self, account: Account) -> None:
         """Register a new account in the ATM system."""
@@ -531,11 +656,11 @@ def test_atm_system() -> None:
     # Test 9: Transaction History Verification
     print("\n[TEST 9] Transaction History")
     assert len(account.transactions) == 3
-    withdrawal_txs = [t for t in account.transactions.values() 
+    withdrawal_txs = [t for t in account.transactions 
                       if t.type == TransactionsType.WITHDRAWAL]
-    deposit_txs = [t for t in account.transactions.values() 
+    deposit_txs = [t for t in account.transactions 
                    if t.type == TransactionsType.DEPOSIT]
-    inquiry_txs = [t for t in account.transactions.values() 
+    inquiry_txs = [t for t in account.transactions 
                    if t.type == TransactionsType.BALANCE_INQUIRY]
     
     assert len(withdrawal_txs) == 1
@@ -566,7 +691,7 @@ def test_atm_system() -> None:
     # Display transaction details
     print("\n📋 TRANSACTION HISTORY FOR ACCOUNT 12345:")
     print("-" * 70)
-    for transaction in account.transactions.values():
+    for transaction in account.transactions:
         print(f"  {transaction}")
     
     print(f"\n💰 Final Account State:")
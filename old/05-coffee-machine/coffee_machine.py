@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from decimal import Decimal
+from functools import lru_cache
+from types import MappingProxyType
 import logging
 
 # Setup logging
@@ -28,6 +30,8 @@ class InsufficientIngredientError(CoffeeError):
 class Ingredient:
     """Ingredient with inventory control."""
 
+    __slots__ = ('name', 'unit', 'cost_per_unit', 'quantity_available')
+
     def __init__(
         self,
         name: str,
@@ -64,14 +68,17 @@ class Ingredient:
         """
         if amount < 0:
             raise ValueError(f"Cannot consume negative amount: {amount}")
-        
-        if not self.has_sufficient(amount):
+
+        # Read once, compare, write back: fuses the has_sufficient
+        # dispatch and the re-read done by the in-place subtract
+        quantity = self.quantity_available
+        if quantity < amount:
             raise InsufficientIngredientError(
                 f"Insufficient {self.name}. "
-                f"Available: {self.quantity_available}{self.unit}, "
+                f"Available: {quantity}{self.unit}, "
                 f"needed: {amount}{self.unit}"
             )
-        self.quantity_available -= amount
+        self.quantity_available = quantity - amount
 
     def refill(self, amount: Decimal) -> None:
         """
@@ -86,12 +93,15 @@ class Ingredient:
         old_quantity = self.quantity_available
         self.quantity_available += amount
         
-        logger.info(
-            "Ingredient refilled: %s +%s%s (before: %s%s, after: %s%s)",
-            self.name, amount, self.unit,
-            old_quantity, self.unit,
-            self.quantity_available, self.unit
-        )
+        # Guarded so the Decimal-to-str conversions only run when INFO
+        # records will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Ingredient refilled: %s +%s%s (before: %s%s, after: %s%s)",
+                self.name, amount, self.unit,
+                old_quantity, self.unit,
+                self.quantity_available, self.unit
+            )
     
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -103,6 +113,9 @@ class Ingredient:
 
 class Recipe:
     """Recipe with ingredient amounts and cost calculation."""
+
+    __slots__ = ('name', '_ingredients', '_ingredients_view', '_items',
+                 '_cost_pairs', '_cost', '_cost_micros')
     
     def __init__(self, name: str, ingredients: dict[Ingredient, Decimal]) -> None:
         """
@@ -122,23 +135,44 @@ class Recipe:
         
         self.name = name
         self._ingredients = ingredients.copy()  # Defensive copy
-    
-    def get_ingredients(self) -> dict[Ingredient, Decimal]:
-        """Get ingredients dictionary (returns copy for immutability)."""
-        return self._ingredients.copy()
+        # Read-only view handed out by get_ingredients; writes raise and
+        # reads allocate nothing
+        self._ingredients_view = MappingProxyType(self._ingredients)
+        # Frozen (ingredient, amount) snapshot: availability checks and
+        # consumption iterate this tuple instead of rebuilding dict views
+        self._items: tuple[tuple[Ingredient, Decimal], ...] = tuple(
+            self._ingredients.items()
+        )
+        # Parallel (cost_per_unit, amount) pairs frozen at build time so
+        # cost calculation is a tight loop over a tuple instead of a
+        # generator over dict views
+        self._cost_pairs: tuple[tuple[Decimal, Decimal], ...] = tuple(
+            (ingredient.cost_per_unit, amount)
+            for ingredient, amount in ingredients.items()
+        )
+        # Recipes are immutable after construction, so the cost is
+        # computed once here instead of per get_cost call
+        total = Decimal(0)
+        for cost_per_unit, amount in self._cost_pairs:
+            total += cost_per_unit * amount
+        self._cost = total
+        # Integer micro-dollars (1e-6) for the beverage cost chain: cents
+        # would truncate sub-cent ingredient costs like $0.0003/ml
+        self._cost_micros = int(total.scaleb(6))
+    
+    def get_ingredients(self) -> MappingProxyType[Ingredient, Decimal]:
+        """Get a read-only view of the ingredients dictionary."""
+        return self._ingredients_view
     
     def get_cost(self) -> Decimal:
-        """Calculate total recipe cost based on ingredients."""
-        return sum(
-            ingredient.cost_per_unit * amount
-            for ingredient, amount in self._ingredients.items()
-        )
+        """Return the recipe cost computed at construction."""
+        return self._cost
     
     def check_availability(self) -> bool:
         """Check if all ingredients are available in sufficient quantity."""
         return all(
-            ingredient.has_sufficient(amount)
-            for ingredient, amount in self._ingredients.items()
+            ingredient.quantity_available >= amount
+            for ingredient, amount in self._items
         )
     
     def consume_ingredients(self) -> None:
@@ -148,20 +182,21 @@ class Recipe:
         Raises:
             InsufficientIngredientError: If any ingredient is insufficient
         """
-        # First pass: check all ingredients
-        if not self.check_availability():
-            unavailable = [
-                ingredient.name 
-                for ingredient, amount in self._ingredients.items()
-                if not ingredient.has_sufficient(amount)
-            ]
+        # One check pass over the frozen snapshot, then one consume pass
+        # with inline subtraction: no rollback stack and no per-item
+        # consume() re-validation
+        items = self._items
+        unavailable = [
+            ingredient.name
+            for ingredient, amount in items
+            if ingredient.quantity_available < amount
+        ]
+        if unavailable:
             raise InsufficientIngredientError(
                 f"Cannot make {self.name}: insufficient {', '.join(unavailable)}"
             )
-        
-        # Second pass: consume all ingredients (safe now)
-        for ingredient, amount in self._ingredients.items():
-            ingredient.consume(amount)
+        for ingredient, amount in items:
+            ingredient.quantity_available -= amount
     
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -176,6 +211,8 @@ class Recipe:
 
 class Coffee(ABC):
     """Abstract base for coffee beverages."""
+
+    __slots__ = ()
     
     @abstractmethod
     def get_description(self) -> str:
@@ -192,15 +229,21 @@ class Coffee(ABC):
 
 class BaseCoffee(Coffee):
     """Concrete base coffee implementation."""
+
+    __slots__ = ('_recipe', '_cost_micros', '_desc_parts')
     
     def __init__(self, recipe: Recipe) -> None:
         self._recipe = recipe
+        # Chain state accumulated eagerly: a stack of N decorators costs
+        # O(1) per cost/description query instead of walking the chain
+        self._cost_micros = recipe._cost_micros
+        self._desc_parts: tuple[str, ...] = (recipe.name,)
     
     def get_description(self) -> str:
         return self._recipe.name
     
     def get_cost(self) -> Decimal:
-        return self._recipe.get_cost()
+        return Decimal(self._cost_micros).scaleb(-6)
     
     def get_base_recipe(self) -> Recipe:
         return self._recipe
@@ -208,79 +251,80 @@ class BaseCoffee(Coffee):
 
 class CoffeeDecorator(Coffee):
     """Abstract decorator for coffee add-ons."""
+
+    __slots__ = ('_coffee', '_cost_micros', '_desc_parts', '_base_recipe')
+    
+    COST = Decimal("0.00")
+    LABEL = ""
+    _COST_MICROS = 0
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Freeze each add-on price as integer micro-dollars once per
+        # class, so wrapping is plain int addition
+        cls._COST_MICROS = int(cls.COST.scaleb(6))
     
     def __init__(self, coffee: Coffee) -> None:
         self._coffee = coffee
+        # Accumulate cost, description parts and the base recipe once at
+        # wrap time so queries never traverse the decorator chain
+        self._cost_micros = coffee._cost_micros + self._COST_MICROS
+        self._desc_parts = (*coffee._desc_parts, self.LABEL)
+        self._base_recipe = coffee.get_base_recipe()
     
     def get_description(self) -> str:
-        return self._coffee.get_description()
+        return " + ".join(self._desc_parts)
     
     def get_cost(self) -> Decimal:
-        return self._coffee.get_cost()
+        return Decimal(self._cost_micros).scaleb(-6)
     
     def get_base_recipe(self) -> Recipe:
-        """Delegate to wrapped coffee to get base recipe."""
-        return self._coffee.get_base_recipe()
+        return self._base_recipe
 
 
 class MilkDecorator(CoffeeDecorator):
     """Adds milk to coffee."""
+
+    __slots__ = ()
     
     COST = Decimal("0.50")
-    
-    def get_description(self) -> str:
-        return f"{self._coffee.get_description()} + Milk"
-    
-    def get_cost(self) -> Decimal:
-        return self._coffee.get_cost() + self.COST
+    LABEL = "Milk"
 
 
 class SugarDecorator(CoffeeDecorator):
     """Adds sugar to coffee."""
+
+    __slots__ = ()
     
     COST = Decimal("0.20")
-    
-    def get_description(self) -> str:
-        return f"{self._coffee.get_description()} + Sugar"
-    
-    def get_cost(self) -> Decimal:
-        return self._coffee.get_cost() + self.COST
+    LABEL = "Sugar"
 
 
 class ExtraShotDecorator(CoffeeDecorator):
     """Adds extra espresso shot to coffee."""
+
+    __slots__ = ()
     
     COST = Decimal("1.00")
-    
-    def get_description(self) -> str:
-        return f"{self._coffee.get_description()} + Extra Shot"
-    
-    def get_cost(self) -> Decimal:
-        return self._coffee.get_cost() + self.COST
+    LABEL = "Extra Shot"
 
 
 class WhippedCreamDecorator(CoffeeDecorator):
     """Adds whipped cream to coffee."""
+
+    __slots__ = ()
     
     COST = Decimal("0.75")
-    
-    def get_description(self) -> str:
-        return f"{self._coffee.get_description()} + Whipped Cream"
-    
-    def get_cost(self) -> Decimal:
-        return self._coffee.get_cost() + self.COST
+    LABEL = "Whipped Cream"
 
 
 class VanillaDecorator(CoffeeDecorator):
     """Adds vanilla flavor to coffee."""
+
+    __slots__ = ()
     
     COST = Decimal("0.60")
-    
-    def get_description(self) -> str:
-        return f"{self._coffee.get_description()} + Vanilla"
-    
-    def get_cost(self) -> Decimal:
-        return self._coffee.get_cost() + self.COST
+    LABEL = "Vanilla"
 
 
 # ==================== COFFEE MACHINE ====================
@@ -291,6 +335,10 @@ class CoffeeMachine:
     def __init__(self) -> None:
         self._ingredients = self._initialize_ingredients()
         self._recipes = self._load_recipes()
+        # Recipes never change after init, so the sorted menu and the
+        # error-message listing are computed once instead of per call
+        self._sorted_types = tuple(sorted(self._recipes))
+        self._sorted_types_joined = ", ".join(self._sorted_types)
         logger.info("Coffee machine initialized with %d recipes", len(self._recipes))
     
     def _initialize_ingredients(self) -> dict[str, Ingredient]:
@@ -336,7 +384,7 @@ class CoffeeMachine:
     
     def get_available_types(self) -> list[str]:
         """Return list of available coffee types."""
-        return sorted(self._recipes.keys())
+        return list(self._sorted_types)
     
     def create_coffee(self, coffee_type: str) -> Coffee:
         """
@@ -345,12 +393,21 @@ class CoffeeMachine:
         Raises:
             CoffeeTypeNotFoundError: If coffee type doesn't exist
         """
-        coffee_type = coffee_type.lower().strip()
         if coffee_type not in self._recipes:
-            available = ", ".join(self.get_available_types())
+            # Normalize only on a miss: callers passing already-canonical
+            # keys (the common case) skip the lower/strip allocations
+            coffee_type = coffee_type.lower().strip()
+        if coffee_type not in self._recipes:
             raise CoffeeTypeNotFoundError(
-                f"Unknown type: '{coffee_type}'. Available: {available}"
+                f"Unknown type: '{coffee_type}'. Available: {self._sorted_types_joined}"
             )
+        return self._base_coffee(coffee_type)
+
+    @lru_cache(maxsize=None)
+    def _base_coffee(self, coffee_type: str) -> BaseCoffee:
+        # BaseCoffee is immutable and recipes are fixed after init, so the
+        # wrapper for each type is built once and shared across orders;
+        # decorators still wrap fresh per order
         return BaseCoffee(self._recipes[coffee_type])
     
     def make_coffee(self, coffee: Coffee) -> dict[str, str | float]:
@@ -371,12 +428,13 @@ class CoffeeMachine:
             "status": "ready"
         }
         
-        logger.info(
-            "Order completed: %s | Cost: $%.2f | Base: %s",
-            order["description"],
-            order["cost"],
-            recipe.name
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Order completed: %s | Cost: $%.2f | Base: %s",
+                order["description"],
+                order["cost"],
+                recipe.name
+            )
         return order
     
     def get_inventory_status(self) -> dict[str, dict[str, str | float]]:
@@ -396,7 +454,8 @@ class CoffeeMachine:
         Raises:
             ValueError: If ingredient doesn't exist
         """
-        ingredient_name = ingredient_name.lower()
+        if ingredient_name not in self._ingredients:
+            ingredient_name = ingredient_name.lower()
         if ingredient_name not in self._ingredients:
             raise ValueError(
                 f"Unknown ingredient: '{ingredient_name}'. "
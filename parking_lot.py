@@ -3,7 +3,10 @@ Parking Lot System - REAL Senior Interview Approach
 Pragmatic, clean, and interview-friendly
 """
 
+import itertools
+
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
 from enum import Enum
 from decimal import Decimal
@@ -21,6 +24,14 @@ class SpotSize(Enum):
     LARGE = 3
 
 
+# Spot sizes each vehicle size fits in, mirroring can_fit_in_spot
+_COMPATIBLE_SPOT_SIZES = {
+    VehicleSize.MOTORCYCLE: (SpotSize.MOTORCYCLE, SpotSize.COMPACT, SpotSize.LARGE),
+    VehicleSize.COMPACT: (SpotSize.COMPACT, SpotSize.LARGE),
+    VehicleSize.LARGE: (SpotSize.LARGE,),
+}
+
+
 # ============================================================================
 # CLASSES SIMPLES - ABORDAGEM SENIOR REAL
 # Em entrevista, você NÃO perde tempo com over-engineering
@@ -29,6 +40,10 @@ class SpotSize(Enum):
 class Vehicle(ABC):
     """Base class for all vehicles."""
 
+    __slots__ = ("license_plate", "size")
+
+    spots_needed = 1  # Class constant; Bus overrides
+
     def __init__(self, license_plate: str, size: VehicleSize):
         self.license_plate = license_plate
         self.size = size
@@ -38,6 +53,22 @@ class Vehicle(ABC):
         """Check if vehicle can fit in spot."""
         pass
 
+    def find_in_level(self, level: 'Level') -> list['ParkingSpot'] | None:
+        """Find spots for this vehicle in a level.
+
+        Default: lowest-index free spot among the compatible per-size
+        queues. Vehicles with special placement rules override this.
+        """
+        best: int | None = None
+        for size in _COMPATIBLE_SPOT_SIZES[self.size]:
+            index = level._first_free_index(size)
+            if index is not None and (best is None or index < best):
+                best = index
+
+        if best is None:
+            return None
+        return [level.spots[best]]
+
     def __repr__(self):
         return f"{self.__class__.__name__}({self.license_plate})"
 
@@ -45,6 +76,8 @@ class Vehicle(ABC):
 class Motorcycle(Vehicle):
     """Motorcycle - fits anywhere."""
 
+    __slots__ = ()
+
     def __init__(self, license_plate: str):
         super().__init__(license_plate, VehicleSize.MOTORCYCLE)
 
@@ -55,6 +88,8 @@ class Motorcycle(Vehicle):
 class Car(Vehicle):
     """Car - fits in compact and large spots."""
 
+    __slots__ = ()
+
     def __init__(self, license_plate: str):
         super().__init__(license_plate, VehicleSize.COMPACT)
 
@@ -64,8 +99,10 @@ class Car(Vehicle):
 
 class Bus(Vehicle):
     """Bus - needs 5 consecutive large spots."""
+
+    __slots__ = ()
     
-    SPOTS_NEEDED = 5  # Class constant - clean!
+    spots_needed = 5  # Class constant - clean!
     
     def __init__(self, license_plate: str):
         super().__init__(license_plate, VehicleSize.LARGE)
@@ -73,9 +110,14 @@ class Bus(Vehicle):
     def can_fit_in_spot(self, spot: 'ParkingSpot') -> bool:
         return spot.size == SpotSize.LARGE
 
+    def find_in_level(self, level: 'Level') -> list['ParkingSpot'] | None:
+        return level._find_consecutive_large_spots(self.spots_needed)
+
 
 class ParkingSpot:
     """Individual parking spot."""
+
+    __slots__ = ("spot_number", "size", "level", "vehicle")
     
     def __init__(self, spot_number: int, size: SpotSize, level: int):
         self.spot_number = spot_number
@@ -103,11 +145,15 @@ class ParkingSpot:
 
 class ParkingTicket:
     """Ticket issued when parking."""
+
+    __slots__ = ("ticket_id", "vehicle", "spots", "level", "entry_time", "exit_time")
     
-    def __init__(self, ticket_id: str, vehicle: Vehicle, spots: list[ParkingSpot]):
+    def __init__(self, ticket_id: str, vehicle: Vehicle, spots: list[ParkingSpot],
+                 level: "Level | None" = None):
         self.ticket_id = ticket_id
         self.vehicle = vehicle
         self.spots = spots
+        self.level = level
         self.entry_time = datetime.now()
         self.exit_time: datetime | None = None
     
@@ -116,9 +162,13 @@ class ParkingTicket:
         if not self.exit_time:
             return Decimal("0")
         
-        hours = (self.exit_time - self.entry_time).total_seconds() / 3600
-        hours_rounded = max(1, int(hours + 0.99))  # Round up
-        return Decimal(hours_rounded) * hourly_rate
+        # Integer ceiling divide on whole seconds: the old
+        # int(hours + 0.99) float trick under-rounds fractions past .99
+        # and paid float/Decimal conversions per call
+        seconds = int((self.exit_time - self.entry_time).total_seconds())
+        hours = max(1, -(-seconds // 3600))
+        rate_cents = int(hourly_rate.scaleb(2))
+        return Decimal(hours * rate_cents).scaleb(-2)
 
 
 class Level:
@@ -133,52 +183,91 @@ class Level:
             for _ in range(count):
                 self.spots.append(ParkingSpot(spot_num, size, level_number))
                 spot_num += 1
+        
+        # Structure-of-arrays mirrors of the spot list: availability
+        # scans walk two contiguous byte arrays instead of dereferencing
+        # a Python object per spot
+        self._sizes = bytes(spot.size.value for spot in self.spots)
+        self._occupied = bytearray(len(self.spots))
+        # One bit per free large spot; run-of-N searches become a few
+        # C-level bignum shifts instead of a Python loop over spots
+        self._large_free_bits = 0
+        for index, spot in enumerate(self.spots):
+            if spot.size is SpotSize.LARGE:
+                self._large_free_bits |= 1 << index
+        # Maintained incrementally so availability queries are O(1)
+        self._available = len(self.spots)
+        # Per-size queues of free spot indices: single-spot parking is a
+        # popleft instead of a scan (order within a size may drift as
+        # freed spots are re-queued)
+        self._free: dict[SpotSize, deque[int]] = {size: deque() for size in SpotSize}
+        for index, spot in enumerate(self.spots):
+            self._free[spot.size].append(index)
     
     def find_spots_for_vehicle(self, vehicle: Vehicle) -> list[ParkingSpot] | None:
         """Find available spots for vehicle."""
-        if isinstance(vehicle, Bus):
-            return self._find_consecutive_large_spots(Bus.SPOTS_NEEDED)
-        
-        # Regular vehicles - find first available
-        for spot in self.spots:
-            if spot.is_available() and vehicle.can_fit_in_spot(spot):
-                return [spot]
-        
+        # Polymorphic dispatch: each vehicle class knows its own
+        # placement rule, so no isinstance check on the hot path
+        return vehicle.find_in_level(self)
+    
+    def _first_free_index(self, size: SpotSize) -> int | None:
+        """Head of the free queue for a size, dropping stale entries."""
+        queue = self._free[size]
+        occupied = self._occupied
+        while queue:
+            index = queue[0]
+            if occupied[index]:
+                # Parked since it was queued; lazy deletion
+                queue.popleft()
+            else:
+                return index
         return None
     
     def _find_consecutive_large_spots(self, count: int) -> list[ParkingSpot] | None:
         """Find consecutive large spots for buses."""
-        consecutive = []
-        
-        for spot in self.spots:
-            if spot.size == SpotSize.LARGE and spot.is_available():
-                consecutive.append(spot)
-                if len(consecutive) == count:
-                    return consecutive
-            else:
-                consecutive = []
-        
-        return None
+        # AND the bitmap with shifted copies of itself: a set bit in the
+        # result marks the start of a run of `count` free large spots
+        bits = self._large_free_bits
+        mask = bits
+        for shift in range(1, count):
+            mask &= bits >> shift
+            if not mask:
+                return None
+        start = (mask & -mask).bit_length() - 1
+        return self.spots[start:start + count]
     
     def park_vehicle(self, vehicle: Vehicle, spots: list[ParkingSpot]) -> bool:
         """Park vehicle in spots."""
-        for spot in spots:
+        for index, spot in enumerate(spots):
             if not spot.park(vehicle):
-                # Rollback
-                for s in spots[:spots.index(spot)]:
+                # Rollback using the loop index; spots.index(spot) was a
+                # linear identity search per failure
+                for s in spots[:index]:
                     s.remove_vehicle()
                 return False
+        occupied = self._occupied
+        for spot in spots:
+            occupied[spot.spot_number] = 1
+            if spot.size is SpotSize.LARGE:
+                self._large_free_bits &= ~(1 << spot.spot_number)
+        self._available -= len(spots)
         return True
     
     def remove_vehicle_from_spots(self, spots: list[ParkingSpot]) -> None:
         """Remove vehicle from spots."""
+        occupied = self._occupied
         for spot in spots:
             spot.remove_vehicle()
+            occupied[spot.spot_number] = 0
+            if spot.size is SpotSize.LARGE:
+                self._large_free_bits |= 1 << spot.spot_number
+            self._free[spot.size].append(spot.spot_number)
+        self._available += len(spots)
     
     @property
     def available_count(self) -> int:
         """Count available spots."""
-        return sum(1 for spot in self.spots if spot.is_available())
+        return self._available
 
 
 class ParkingLot:
@@ -187,7 +276,7 @@ class ParkingLot:
     def __init__(self, num_levels: int, spots_per_level: dict[SpotSize, int]):
         self.levels = [Level(i, spots_per_level) for i in range(num_levels)]
         self.tickets: dict[str, ParkingTicket] = {}
-        self._ticket_counter = 0
+        self._ticket_counter = itertools.count(1)
     
     def park_vehicle(self, vehicle: Vehicle) -> ParkingTicket | None:
         """Park vehicle and return ticket."""
@@ -197,7 +286,8 @@ class ParkingLot:
                 ticket = ParkingTicket(
                     ticket_id=self._generate_ticket_id(),
                     vehicle=vehicle,
-                    spots=spots
+                    spots=spots,
+                    level=level
                 )
                 self.tickets[ticket.ticket_id] = ticket
                 return ticket
@@ -213,9 +303,8 @@ class ParkingLot:
         ticket.exit_time = datetime.now()
         fee = ticket.calculate_fee()
         
-        # Free up spots
-        level = self.levels[ticket.spots[0].level]
-        level.remove_vehicle_from_spots(ticket.spots)
+        # Free up spots via the level captured at issue time
+        ticket.level.remove_vehicle_from_spots(ticket.spots)
         
         del self.tickets[ticket_id]
         return ticket, fee
@@ -224,10 +313,35 @@ class ParkingLot:
         """Get total available spots."""
         return sum(level.available_count for level in self.levels)
     
+    def bulk_compute_fees(
+        self,
+        tickets: list[ParkingTicket],
+        hourly_rate: Decimal = Decimal("5.00"),
+    ) -> list[Decimal]:
+        """Compute fees for a batch of closed tickets.
+
+        Integer-cents math in a tight loop with the hot names bound to
+        locals; Decimal only at the edges. Open tickets (no exit time)
+        get a zero fee, matching calculate_fee.
+        """
+        rate_cents = int(hourly_rate.scaleb(2))
+        from_cents = Decimal
+        fees: list[Decimal] = []
+        append = fees.append
+        zero = Decimal("0")
+        for ticket in tickets:
+            exit_time = ticket.exit_time
+            if not exit_time:
+                append(zero)
+                continue
+            seconds = int((exit_time - ticket.entry_time).total_seconds())
+            hours = max(1, -(-seconds // 3600))
+            append(from_cents(hours * rate_cents).scaleb(-2))
+        return fees
+    
     def _generate_ticket_id(self) -> str:
         """Generate unique ticket ID."""
-        self._ticket_counter += 1
-        return f"TKT-{self._ticket_counter:06d}"
+        return f"TKT-{next(self._ticket_counter):06d}"
 
 
 # ============================================================================